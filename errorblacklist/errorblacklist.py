@@ -1,8 +1,20 @@
 # Copyright (c) 2021 - Jojo#7791
 # Licensed under MIT
 
+import datetime
 import logging
-from typing import Dict, Final, List, Tuple, Literal, Union, TYPE_CHECKING
+from collections import defaultdict
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Final,
+    List,
+    Tuple,
+    Literal,
+    Union,
+    TYPE_CHECKING,
+)
 
 import discord
 from discord.ext import tasks
@@ -57,7 +69,7 @@ class ErrorBlacklist(commands.Cog):
     """
 
     __authors__: Final[List[str]] = ["Jojo#7791"]
-    __version__: Final[str] = "1.1.1"
+    __version__: Final[str] = "1.2.0"
 
     def format_help_for_context(self, ctx: commands.Context) -> str:
         plural = "" if len(self.__authors__) == 1 else "s"
@@ -70,28 +82,46 @@ class ErrorBlacklist(commands.Cog):
     def __init__(self, bot: Red):
         self.bot = bot
         self.config = Config.get_conf(self, 544974305445019651, True)
-        [
+        for key, value in _config_structure.items():
             getattr(self.config, f"register_{key}", lambda **z: z)(**value)
-            for key, value in _config_structure.items()
-        ]
-        self._cache: dict = {}
-        self.first_run: bool = True
+        self._cache: DefaultDict[int, DefaultDict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        self._settings: Dict[str, Any] = {}
 
     async def cog_check(self, ctx: commands.Context) -> bool:  # type:ignore
         return await ctx.bot.is_owner(ctx.author)
 
     async def cog_load(self) -> None:
-        if await self.config.clear_usage():
+        await self._load_settings()
+        if self._settings["clear_usage"]:
             self.clear_cache.start()
-        self._cache = await self.config.all_users()
+        for user_id, data in (await self.config.all_users()).items():
+            self._cache[user_id].update(data["errors"])
+
+    async def _load_settings(self) -> None:
+        data = await self.config.all()
+        self._settings = {
+            "enabled": data["enabled"],
+            "amount": data["amount"],
+            "clear_usage": data["clear_usage"],
+            "message": data["message"],
+            "message_enabled": data["message_enabled"],
+            "ignore_guilds": set(data["ignore"]["guilds"]),
+            "ignore_channels": set(data["ignore"]["channels"]),
+            "whitelist_commands": set(data["whitelist"]["commands"]),
+            "whitelist_cogs": set(data["whitelist"]["cogs"]),
+            "whitelist_users": set(data["whitelist"]["users"]),
+        }
 
     async def cog_unload(self) -> None:
         if self.clear_cache.is_running():
             self.clear_cache.cancel()
 
     async def red_delete_data_for_user(self, *, requester: RequestType, user_id: int) -> None:
-        """This cog does not store any data"""
-        return
+        """Remove a user's recorded command errors"""
+        self._cache.pop(user_id, None)
+        await self.config.user_from_id(user_id).clear()
 
     @commands.command()
     async def errblversion(self, ctx: commands.Context):
@@ -125,12 +155,14 @@ class ErrorBlacklist(commands.Cog):
             - `guild_or_channel` The guild or channel to ignore.
         """
         guild = "guild" if isinstance(guild_or_channel, discord.Guild) else "channel"
-        coro = getattr(self.config.ignore, f"{guild}s")  # Being lazy is fun
-        async with coro() as data:
-            if guild_or_channel.id in data:
-                return await ctx.send(f"That {guild} is already being ignored")
-            data.append(guild_or_channel.id)
-        await ctx.send(f"I will now ignore the {guild} `{guild_or_channel.name}`")
+        await self._add_to_collection(
+            ctx,
+            "ignore",
+            guild,
+            guild_or_channel.id,
+            f"That {guild} is already being ignored",
+            f"I will now ignore the {guild} `{guild_or_channel.name}`",
+        )
 
     @error_blacklist_ignore.command(name="remove", aliases=["del", "delete", "rm"])
     async def ignore_remove(self, ctx: commands.Context, guild_or_channel: ChannelOrGuild):
@@ -142,12 +174,14 @@ class ErrorBlacklist(commands.Cog):
             - `guild_or_channel` The guild or channel to remove from the ignored list.
         """
         guild = "guild" if isinstance(guild_or_channel, discord.Guild) else "channel"
-        coro = getattr(self.config.ignore, f"{guild}s")
-        async with coro() as data:
-            if (_id := guild_or_channel.id) not in data:
-                return await ctx.send(f"That {guild} is not in the ignored list")
-            data.remove(_id)
-        await ctx.send(f"I will no longer ignore the {guild} `{guild_or_channel.name}`")
+        await self._remove_from_collection(
+            ctx,
+            "ignore",
+            guild,
+            guild_or_channel.id,
+            f"That {guild} is not in the ignored list",
+            f"I will no longer ignore the {guild} `{guild_or_channel.name}`",
+        )
 
     @error_blacklist_ignore.command(name="list")
     async def ignore_list(self, ctx: commands.Context):
@@ -155,10 +189,10 @@ class ErrorBlacklist(commands.Cog):
         coro = self.config.ignore
         data = []
         if guilds := await coro.guilds():
-            guilds.insert(0, "**Guilds**")
+            data.append("**Guilds**")
             data.extend(guilds)
         if channels := await coro.channels():
-            channels.insert(0, "**Channels**")
+            data.append("**Channels**")
             data.extend(channels)
         if not data:
             return await ctx.send("The ignore list is empty")
@@ -172,19 +206,23 @@ class ErrorBlacklist(commands.Cog):
 
         If enabled it will watch for when a user uses a command that errors.
         """
-        coro = self.config.enabled
-        await coro.set(not await coro())
-        enabled = "enabled" if await coro() else "disabled"
+        new = not self._settings["enabled"]
+        await self.config.enabled.set(new)
+        self._settings["enabled"] = new
+        enabled = "enabled" if new else "disabled"
         await ctx.send(f"The error watcher is now {enabled}.")
 
     @errorblacklist.command(name="clearusage")
     async def error_blacklist_clear_usage(self, ctx: commands.Context, toggle: bool):
-        """Have the watcher remove command usage after a day"""
+        """Have the watcher clear command usage daily at midnight UTC"""
         coro = self.config.clear_usage
         enabled = "enabled" if toggle else "disabled"
-        if await coro() is toggle:
+        if self._settings["clear_usage"] is toggle:
             return await ctx.send(f"Usage clearing is already {enabled}.")
         await coro.set(toggle)
+        self._settings["clear_usage"] = toggle
+        if toggle and not self.clear_cache.is_running():
+            self.clear_cache.start()
         await ctx.send(f"Usage clearing is now {enabled}.")
 
     @errorblacklist.command(name="amount")
@@ -193,6 +231,7 @@ class ErrorBlacklist(commands.Cog):
         if amount == 1:
             return await ctx.send("1?! Have mercy on them for Billy Bob's sake")
         await self.config.amount.set(amount)
+        self._settings["amount"] = amount
         await ctx.send(
             f"Done. If a user uses a command that errors `{amount}` times they will be blacklisted"
         )
@@ -217,14 +256,15 @@ class ErrorBlacklist(commands.Cog):
             - `user_or_command` The user, cog, or command to whitelist.
         """
         is_user, user, to_add = self._get_user_or_com(user_com_or_cog)
-
-        val = getattr(self.config.whitelist, f"{user}s")
-        if to_add in await val():
-            return await ctx.send(f"That {user} is already in the whitelist.")
-        user = f"{user} id" if is_user else user
-        await ctx.send(f"Done. Added `{to_add}` to the whitelist as a {user}.")
-        async with val() as f:
-            f.append(to_add)
+        label = f"{user} id" if is_user else user
+        await self._add_to_collection(
+            ctx,
+            "whitelist",
+            user,
+            to_add,
+            f"That {user} is already in the whitelist.",
+            f"Done. Added `{to_add}` to the whitelist as a {label}.",
+        )
 
     @error_blacklist_whitelist.command(name="remove", aliases=["del", "delete"])
     async def whitelist_remove(self, ctx: commands.Context, user_com_or_cog: UserOrCommandCog):
@@ -235,15 +275,53 @@ class ErrorBlacklist(commands.Cog):
         **Arguments**
             - `user_or_command` The user, cog, or command to be removed from the whitelist
         """
-        is_user, user, to_add = self._get_user_or_com(user_com_or_cog)
-        val = getattr(self.config.whitelist, f"{user}s")
-        if to_add not in await val():
-            return await ctx.send(f"That {user} is not in the whitelist.")
-        user = f"{user} id" if is_user else user
-        await ctx.send(f"Done. Removed `{to_add}` from the whitelist as a {user}")
+        is_user, user, to_remove = self._get_user_or_com(user_com_or_cog)
+        label = f"{user} id" if is_user else user
+        await self._remove_from_collection(
+            ctx,
+            "whitelist",
+            user,
+            to_remove,
+            f"That {user} is not in the whitelist.",
+            f"Done. Removed `{to_remove}` from the whitelist as a {label}",
+        )
 
-        async with val() as f:
-            f.remove(to_add)
+    async def _add_to_collection(
+        self,
+        ctx: commands.Context,
+        group: str,
+        kind: str,
+        value: Union[str, int],
+        already_msg: str,
+        ok_msg: str,
+    ) -> None:
+        cached = self._settings[f"{group}_{kind}s"]
+        if value in cached:
+            await ctx.send(already_msg)
+            return
+        async with getattr(getattr(self.config, group), f"{kind}s")() as data:
+            data.append(value)
+            data[:] = sorted(set(data))
+        cached.add(value)
+        await ctx.send(ok_msg)
+
+    async def _remove_from_collection(
+        self,
+        ctx: commands.Context,
+        group: str,
+        kind: str,
+        value: Union[str, int],
+        missing_msg: str,
+        ok_msg: str,
+    ) -> None:
+        cached = self._settings[f"{group}_{kind}s"]
+        if value not in cached:
+            await ctx.send(missing_msg)
+            return
+        async with getattr(getattr(self.config, group), f"{kind}s")() as data:
+            data[:] = sorted(set(data) - {value})
+        cached.discard(value)
+        await ctx.send(ok_msg)
 
     @staticmethod
     def _get_user_or_com(maybe_user: UserOrCommandCog) -> Tuple[bool, str, Union[str, int]]:
@@ -264,7 +342,7 @@ class ErrorBlacklist(commands.Cog):
         data: list = []
         for key, value in [["commands", coms], ["cogs", cogs], ["users", users]]:
             if value:
-                value.insert(0, f"**{key.upper()}**")
+                data.append(f"**{key.upper()}**")
                 data.extend(value)
         data = list(pagify("\n".join(str(x) for x in data), page_length=200))
         await Menu(Page(data)).start(ctx)
@@ -285,16 +363,18 @@ class ErrorBlacklist(commands.Cog):
             - `message` The message sent to warn the user. Type `None` to reset it.
         """
         set_reset = "set" if message else "reset"
-        actual = message or _config_structure["message"]
+        actual = message or _config_structure["global"]["message"]
         await self.config.message.set(actual)
+        self._settings["message"] = actual
         await ctx.send(f"The message has been {set_reset}")
 
     @error_blacklist_message.command(name="enable", aliases=("toggle", "disable"))
     async def message_enable(self, ctx: commands.Context):
         """Toggle whether the warning message should be sent or not."""
-        data = await (coro := self.config.message_enabled)()
-        toggle = "disabled" if data else "enabled"
-        await coro.set(not data)
+        new = not self._settings["message_enabled"]
+        toggle = "enabled" if new else "disabled"
+        await self.config.message_enabled.set(new)
+        self._settings["message_enabled"] = new
         await ctx.send(f"The warning message has been {toggle}.")
 
     @errorblacklist.command(name="showsettings", aliases=["settings"])
@@ -313,7 +393,8 @@ class ErrorBlacklist(commands.Cog):
             embed = discord.Embed(
                 title="Error Blacklist settings", colour=await ctx.embed_colour()
             )
-            [embed.add_field(name=key, value=value, inline=False) for key, value in data.items()]
+            for key, value in data.items():
+                embed.add_field(name=key, value=value, inline=False)
             await ctx.send(embed=embed)
             return
         await ctx.send(
@@ -325,6 +406,10 @@ class ErrorBlacklist(commands.Cog):
     async def on_command_error(
         self, ctx: commands.Context, err: Exception, unhandled_by_cog=False
     ):
+        settings = self._settings
+        if not settings["enabled"]:
+            return
+
         if not unhandled_by_cog:
             if hasattr(ctx.command, "on_error"):
                 return
@@ -336,56 +421,52 @@ class ErrorBlacklist(commands.Cog):
             return
 
         user = ctx.author
-        if not await self.config.enabled() or await self.bot.is_owner(user):
-            return
-
         if ctx.guild:
             log.debug("In a guild")
             gid, cid = ctx.guild.id, (
                 chan.id if (chan := ctx.channel) is not None else "No channel found."
             )  # Not sure why
-            coro = self.config.ignore
-            if gid in await coro.guilds() or (
-                not isinstance(cid, str) and cid in await coro.channels()
+            if gid in settings["ignore_guilds"] or (
+                not isinstance(cid, str) and cid in settings["ignore_channels"]
             ):
                 log.debug("Ignored tbh")
                 return
 
         name = ctx.command.qualified_name
-        if name in await self.config.whitelist.commands():
+        if name in settings["whitelist_commands"]:
+            return
+        if ctx.command.cog_name in settings["whitelist_cogs"]:
             return
-        if user.id in await self.config.whitelist.users():
+        if user.id in settings["whitelist_users"]:
             return
-        if await self.config.message_enabled():
-            await ctx.send(await self.config.message())
-
-        if user.id not in self._cache.keys():
-            self._cache[user.id] = {name: 1}
-        else:
-            try:
-                self._cache[user.id][name] += 1
-            except KeyError:
-                self._cache[user.id][name] = 1
-
-        amount = await self.config.amount()
-        if (am := self._cache[user.id].get(ctx.command.name)) and am >= amount:
+        if user.id in self.bot.owner_ids:
+            return
+        if settings["message_enabled"]:
+            await ctx.send(settings["message"])
+
+        errors = self._cache[user.id]
+        errors[name] += 1
+        await self.config.user_from_id(user.id).errors.set(errors)
+
+        if (am := errors[name]) >= settings["amount"]:
             log.info(
                 f"Blacklisted {user} ({user.id}) as they have "
                 f"used a command that has errored {am} times."
             )
             await self.bot.add_to_blacklist({user})
+            self._cache.pop(user.id, None)
+            await self.config.user_from_id(user.id).clear()
             self.bot.dispatch("error_blacklist", user, ctx.command)
 
-    @tasks.loop(hours=24)
+    @tasks.loop(time=datetime.time(hour=0, minute=0, tzinfo=datetime.timezone.utc))
     async def clear_cache(self):
-        if self.first_run:
-            self.first_run = False
-            return
-        if not await self.config.clear_usage():
+        if not self._settings["clear_usage"]:
             self.clear_cache.cancel()
             return
-        for user in (await self.config.all_users()).keys():
-            await self.config.user_from_id(user).clear()
+        if not self._cache:
+            return
+        await self.config.clear_all_users()
+        self._cache.clear()
         log.debug("Cleared user usage")
 
     @clear_cache.before_loop